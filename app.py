@@ -7,24 +7,53 @@ Features: Param Validation, Timeout Mgmt, Voice Discovery, Streaming.
 
 import argparse
 import asyncio
+import contextlib
+import codecs
+import concurrent.futures
+import hashlib
+import itertools
+import json
 import logging
+import mmap
+import multiprocessing
+import os
 import re
+import shutil
+import subprocess
 import sys
+import tempfile
+import threading
+import time
 import signal
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import AsyncIterator, Callable, Deque, Iterator, List, Optional
 
 # Dependencias de terceros
 import edge_tts
-import PyPDF2
-from edge_tts.communicate import remove_incompatible_characters
+import pymupdf
 from edge_tts.exceptions import NoAudioReceived, UnexpectedResponse, WebSocketError
 
+# Opcional: orjson acelera la (de)serialización de la caché de voces
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = lambda obj: orjson.dumps(obj).decode()
+except ImportError:
+    _loads = json.loads
+    _dumps = json.dumps
+
 # ═══════════════════════════════════════
 # ⚙️ CONFIGURACIÓN Y LOGGING
 # ═══════════════════════════════════════
 
+# El formato no usa hilo/proceso: evita getpid()/get_ident() en cada registro
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s [%(levelname)s] %(message)s",
@@ -44,6 +73,45 @@ class AppConfig:
     pitch: str
     connect_timeout: int = 10
     receive_timeout: int = 60
+    use_cache: bool = True
+
+@dataclass
+class PageStats:
+    """Recuento de las páginas que `iter_pages` ha leído del PDF."""
+    pages: int = 0
+    skipped: int = 0 # Sin texto útil (escaneos, imágenes)
+
+# Tiempo máximo esperando salida de pdftotext (Poppler) antes de matarlo
+PDFTOTEXT_TIMEOUT = 300
+# A partir de este nº de páginas compensa repartir la extracción entre procesos
+PARALLEL_MIN_PAGES = 50
+# Páginas con menos caracteres útiles se consideran vacías (escaneos, imágenes)
+MIN_PAGE_CHARS = 8
+# Páginas en vuelo entre el lector de PDF y la síntesis
+PAGE_QUEUE_SIZE = 4
+# Buffer de escritura del MP3: agrupa los chunks pequeños del WebSocket
+OUTPUT_BUFFER_SIZE = 1024 * 1024
+# Intervalo mínimo entre refrescos de la barra de progreso (~10 Hz)
+PROGRESS_INTERVAL = 0.1
+# Vigencia de la lista de voces cacheada en disco (24 h)
+VOICES_CACHE_TTL = 24 * 3600
+# Subdirectorio de la caché con el audio ya sintetizado
+AUDIO_CACHE_DIR = "audio"
+# Tamaño máximo de esa caché; se eliminan primero los bloques menos usados
+AUDIO_CACHE_MAX_BYTES = 512 * 1024 * 1024
+# Temporales de la caché más antiguos que esto son restos de ejecuciones rotas
+AUDIO_CACHE_TMP_MAX_AGE = 3600
+# Tamaño objetivo (caracteres) de cada petición de síntesis
+CHUNK_CHARS = 3000
+# Peticiones de síntesis simultáneas contra el servicio
+MAX_CONCURRENCY = 8
+
+# Patrones oficiales de Microsoft (compilados una sola vez)
+_RE_RATE = re.compile(r"[+-]\d+%")
+_RE_VOLUME = re.compile(r"[+-]\d+%")
+_RE_PITCH = re.compile(r"[+-]\d+Hz")
+# Fin de frase: punto, cierre de exclamación o interrogación seguido de espacio
+_RE_SENTENCE = re.compile(r"(?<=[.!?])\s+")
 
 # ═══════════════════════════════════════
 # 🛡️ VALIDACIÓN Y UTILIDADES
@@ -54,38 +122,76 @@ def validate_voice_params(rate: str, volume: str, pitch: str) -> None:
     Valida estrictamente los parámetros según la documentación de edge-tts.
     Evita fallos de API antes de iniciar la conexión.
     """
-    # Patrones oficiales de Microsoft
-    patterns = {
-        "rate": (r"^[+-]\d+%$", "Ej: +10%, -15%"),
-        "volume": (r"^[+-]\d+%$", "Ej: +20%, -10%"),
-        "pitch": (r"^[+-]\d+Hz$", "Ej: +5Hz, -2Hz")
-    }
-
-    for param, value in [("rate", rate), ("volume", volume), ("pitch", pitch)]:
-        regex, help_text = patterns[param]
-        if not re.match(regex, value):
+    checks = (
+        (_RE_RATE, "rate", rate, "Ej: +10%, -15%"),
+        (_RE_VOLUME, "volume", volume, "Ej: +20%, -10%"),
+        (_RE_PITCH, "pitch", pitch, "Ej: +5Hz, -2Hz"),
+    )
+
+    for pattern, param, value, help_text in checks:
+        if not pattern.fullmatch(value):
             raise ValueError(
                 f"❌ Parámetro inválido '{param}': {value}\n"
                 f"   Formato requerido: {help_text}"
             )
 
+def validate_voice(voice: str) -> None:
+    """
+    Valida el ID de voz con la propia comprobación de edge_tts.Communicate
+    (sin red), para no crear el MP3 con una voz que el servicio rechazará.
+    """
+    try:
+        edge_tts.Communicate(".", voice)
+    except ValueError:
+        raise ValueError(
+            f"❌ Parámetro inválido 'voice': {voice}\n"
+            f"   Formato requerido: Ej: es-MX-DaliaNeural (ver --list-voices)"
+        ) from None
+
+def _cache_dir() -> Path:
+    """Directorio de caché del usuario (respeta XDG_CACHE_HOME)."""
+    # Una variable vacía equivale a no definida (especificación XDG)
+    return Path(os.environ.get("XDG_CACHE_HOME") or "~/.cache").expanduser() / "edge-tts"
+
+async def _load_voices() -> List[dict]:
+    """Lista de voces con caché en disco para evitar la consulta HTTPS."""
+    cache = _cache_dir() / "voices.json"
+    try:
+        if time.time() - cache.stat().st_mtime < VOICES_CACHE_TTL:
+            return _loads(cache.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        pass # Sin caché o corrupta: se vuelve a descargar
+
+    voices = await edge_tts.list_voices()
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        cache.write_text(_dumps(voices), encoding="utf-8")
+    except OSError as e:
+        logger.warning(f"⚠️ No se pudo guardar la caché de voces: {e}")
+    return voices
+
 async def list_available_voices(locale_prefix: str = "es-") -> None:
     """Muestra una tabla de voces disponibles filtradas por idioma."""
     print(f"🔍 Buscando voces con prefijo: '{locale_prefix}'...")
     try:
-        voices = await edge_tts.list_voices()
-        # Filtrar voces latinas/hispanas y neuronales
-        filtered = [
-            v for v in voices 
-            if v['Locale'].startswith(locale_prefix) and "Neural" in v['ShortName']
-        ]
+        voices = await _load_voices()
+        # Filtrar voces latinas/hispanas y neuronales (una lectura por clave)
+        prefixes = (locale_prefix,)
+        filtered = []
+        for v in voices:
+            locale = v["Locale"]
+            if not locale.startswith(prefixes):
+                continue
+            short_name = v["ShortName"]
+            if "Neural" in short_name:
+                filtered.append((short_name, v["Gender"], locale))
         
         print("\n" + "═"*60)
         print(f"{'NOMBRE CORTO':<35} | {'GÉNERO':<10} | {'REGIÓN'}")
         print("─"*60)
         
-        for v in filtered:
-            print(f"{v['ShortName']:<35} | {v['Gender']:<10} | {v['Locale']}")
+        for short_name, gender, locale in filtered:
+            print(f"{short_name:<35} | {gender:<10} | {locale}")
             
         print("═"*60 + "\n")
         
@@ -96,48 +202,347 @@ async def list_available_voices(locale_prefix: str = "es-") -> None:
 # 🛠️ LÓGICA DE NEGOCIO (CORE)
 # ═══════════════════════════════════════
 
-def extract_clean_text(file_path: Path) -> str:
-    """Extrae y sanitiza el texto usando las herramientas oficiales."""
+def _pdftotext_pages(
+    binary: str,
+    file_path: Path,
+    stop: Optional[threading.Event] = None
+) -> Iterator[str]:
+    """
+    Vía rápida: un único proceso de Poppler en lugar de iterar páginas en
+    Python. Su salida se lee en streaming y se corta por páginas.
+    Un vigilante mata el proceso si se cuelga o si se activa `stop`.
+    """
+    proc = subprocess.Popen(
+        [binary, "-q", "-enc", "UTF-8", str(file_path), "-"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True # Ctrl+C lo gestiona la app, no el hijo
+    )
+    deadline = None # Solo hay límite mientras se espera a pdftotext
+    expired = threading.Event()
+    finished = threading.Event()
+
+    def watchdog() -> None:
+        # read1()/wait() bloquean sin timeout: la única salida es matar al hijo
+        while not finished.wait(0.1):
+            if deadline is not None and time.monotonic() > deadline:
+                expired.set()
+            elif stop is None or not stop.is_set():
+                continue
+            proc.kill()
+            return
+
+    threading.Thread(target=watchdog, daemon=True).start()
+    try:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        pending = ""
+        while True:
+            deadline = time.monotonic() + PDFTOTEXT_TIMEOUT
+            chunk = proc.stdout.read1(1 << 16)
+            deadline = None # Sin límite mientras se sintetizan las páginas
+            if not chunk:
+                break
+            # pdftotext termina cada página con un salto de página (\f)
+            *pages, pending = (pending + decoder.decode(chunk)).split("\f")
+            yield from pages
+
+        deadline = time.monotonic() + PDFTOTEXT_TIMEOUT
+        returncode = proc.wait()
+        if expired.is_set():
+            raise subprocess.TimeoutExpired(proc.args, PDFTOTEXT_TIMEOUT)
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, binary)
+        pending += decoder.decode(b"", final=True)
+        if pending.strip():
+            yield pending
+    finally:
+        finished.set()
+        proc.stdout.close()
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+
+def _normalize(text: str) -> str:
+    """Colapsa espacios y saltos de línea (str.split está implementado en C)."""
+    return " ".join(text.split())
+
+@contextlib.contextmanager
+def _open_pdf(path) -> Iterator["pymupdf.Document"]:
+    """
+    Abre el PDF mapeado en memoria (mmap): MuPDF lee directamente de la
+    caché de páginas del SO, sin copias en buffers de Python.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise ValueError(f"PDF vacío: {path}")
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mm)
+    try:
+        doc = pymupdf.open(stream=view, filetype="pdf")
+        try:
+            yield doc
+        finally:
+            doc.close()
+    finally:
+        # Se libera el mapeo junto con el documento, sin esperar al GC
+        view.release()
+        mm.close()
+
+# Documento abierto una sola vez por cada proceso del pool; el mapeo dura
+# lo mismo que el proceso
+_worker_stack = contextlib.ExitStack()
+_worker_doc = None
+
+def _init_worker(path: str) -> None:
+    """Inicializador del pool: cada proceso abre el PDF una única vez."""
+    global _worker_doc
+    # Ctrl+C llega a todo el grupo de procesos: lo gestiona el proceso principal
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _worker_doc = _worker_stack.enter_context(_open_pdf(path))
+
+def _clean_text(raw: str) -> str:
+    """Normaliza el texto de una página ("" si no tiene texto útil)."""
+    if not raw or len(raw.strip()) < MIN_PAGE_CHARS:
+        return ""
+    return _normalize(raw)
+
+def _clean_page(page) -> str:
+    """Extrae y normaliza el texto de una página de PyMuPDF."""
+    return _clean_text(page.get_text("text"))
+
+def _extract_page(index: int) -> str:
+    """Tarea del pool: extrae la página `index` del documento del proceso."""
+    return _clean_page(_worker_doc[index])
+
+def _iter_pages_parallel(file_path: Path, total: int) -> Iterator[str]:
+    """Reparte las páginas entre núcleos y las devuelve en orden."""
+    # "spawn": el pool se crea desde un hilo con el event loop en marcha y
+    # hacer fork de un proceso multihilo puede bloquearse
+    executor = ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(str(file_path),)
+    )
+    try:
+        yield from executor.map(_extract_page, range(total), chunksize=8)
+    finally:
+        # Si se interrumpe la lectura, no esperar al resto de páginas
+        executor.shutdown(cancel_futures=True)
+
+def _page_count(file_path: Path) -> int:
+    """Valida el PDF y devuelve su número de páginas (solo lee el xref)."""
     if not file_path.exists():
         raise FileNotFoundError(f"Archivo no encontrado: {file_path}")
+    with _open_pdf(file_path) as doc:
+        total = doc.page_count
+    if total == 0: raise ValueError("PDF vacío")
+    return total
 
+def _iter_page_texts(
+    file_path: Path,
+    total: int,
+    stop: Optional[threading.Event] = None
+) -> Iterator[str]:
+    """
+    Produce en orden el texto normalizado de cada página ("" si no tiene
+    texto útil) sin acumular el documento en memoria. `total` (de PyMuPDF)
+    solo decide si compensa el pool; pdftotext puede dar otro nº de páginas.
+    `stop` interrumpe a pdftotext si el consumidor deja de leer.
+    """
     logger.info(f"📖 Leyendo PDF: {file_path.name}")
-    text_buffer = []
 
+    with contextlib.ExitStack() as stack:
+        pages = None
+        pdftotext = shutil.which("pdftotext")
+        if pdftotext:
+            raw_pages = stack.enter_context(
+                contextlib.closing(_pdftotext_pages(pdftotext, file_path, stop))
+            )
+            try:
+                # Solo se puede recurrir a PyMuPDF antes de entregar páginas
+                first = next(raw_pages, None)
+            except (subprocess.SubprocessError, OSError) as e:
+                logger.warning(f"⚠️ pdftotext falló ({e}), usando PyMuPDF.")
+            else:
+                head = () if first is None else (first,)
+                pages = (_clean_text(raw) for raw in itertools.chain(head, raw_pages))
+
+        if pages is None:
+            if total >= PARALLEL_MIN_PAGES and (os.cpu_count() or 1) > 1:
+                pages = stack.enter_context(
+                    contextlib.closing(_iter_pages_parallel(file_path, total))
+                )
+            else:
+                # ✅ PyMuPDF: motor C de MuPDF, mucho más rápido que PyPDF2
+                doc = stack.enter_context(_open_pdf(file_path))
+                pages = (_clean_page(page) for page in doc)
+
+        yield from pages
+
+class _ReaderStopped(Exception):
+    """El consumidor de `iter_pages` dejó de leer (Ctrl+C o fin anticipado)."""
+
+async def iter_pages(
+    file_path: Path,
+    total: Optional[int] = None,
+    stats: Optional[PageStats] = None
+) -> AsyncIterator[str]:
+    """
+    Produce el texto de cada página mientras el PDF se sigue leyendo en un hilo.
+    La cola acotada solapa lectura y red sin acumular todo el documento.
+    `total` evita volver a contar las páginas si ya se validó el PDF.
+    `stats`, si se indica, recibe el recuento de páginas leídas y omitidas.
+    """
+    stats = stats if stats is not None else PageStats()
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=PAGE_QUEUE_SIZE)
+    stop = threading.Event()
+    done = object()
+
+    def put(item) -> None:
+        # Bloquea el hilo lector mientras la cola esté llena (backpressure),
+        # pero sin esperar para siempre si el consumidor ya no va a leer
+        try:
+            future = asyncio.run_coroutine_threadsafe(queue.put(item), loop)
+        except RuntimeError: # Event loop cerrado
+            raise _ReaderStopped() from None
+        while True:
+            if stop.is_set():
+                future.cancel()
+                raise _ReaderStopped()
+            try:
+                return future.result(timeout=0.1) # Revisa `stop` cada 0,1 s
+            except concurrent.futures.TimeoutError:
+                continue
+            except concurrent.futures.CancelledError: # Loop cerrándose
+                raise _ReaderStopped() from None
+
+    def reader() -> None:
+        try:
+            pages = _iter_page_texts(file_path, total or _page_count(file_path), stop)
+            with contextlib.closing(pages):
+                for text in pages:
+                    stats.pages += 1
+                    if text:
+                        put(text)
+                    else:
+                        stats.skipped += 1
+            put(done)
+        except _ReaderStopped:
+            return # Cancelado por el usuario: no es un fallo de lectura
+        except Exception as e:
+            if stop.is_set():
+                return
+            logger.error(f"Fallo crítico en lectura de PDF: {e}")
+            with contextlib.suppress(_ReaderStopped):
+                put(done)
+            raise
+
+    producer = asyncio.create_task(asyncio.to_thread(reader))
     try:
-        with open(file_path, 'rb') as f:
-            reader = PyPDF2.PdfReader(f)
-            total = len(reader.pages)
-            
-            if total == 0: raise ValueError("PDF vacío")
-
-            for i, page in enumerate(reader.pages):
-                raw = page.extract_text()
-                if raw:
-                    # ✅ USO OFICIAL: remove_incompatible_characters
-                    clean = remove_incompatible_characters(raw)
-                    text_buffer.append(clean)
-                
-                # Feedback de progreso
-                if (i + 1) % 25 == 0:
-                    sys.stdout.write(f"\r   ⏳ Extrayendo pág. {i+1}/{total}...")
-                    sys.stdout.flush()
-            
-            sys.stdout.write("\r" + " "*50 + "\r") # Limpiar línea
+        while (text := await queue.get()) is not done:
+            yield text
+        await producer # Propaga errores de lectura
+    finally:
+        stop.set()
+        while not queue.empty():
+            queue.get_nowait() # Desbloquea al lector si quedó esperando
+        if not producer.done():
+            producer.cancel()
 
-    except Exception as e:
-        logger.error(f"Fallo crítico en lectura de PDF: {e}")
-        raise
+def _audio_cache_path(config: AppConfig, text: str) -> Path:
+    """Ruta en caché del audio para (texto, voz, rate, volume, pitch)."""
+    key = hashlib.blake2b(
+        f"{config.voice}|{config.rate}|{config.volume}|{config.pitch}|".encode() + text.encode(),
+        digest_size=16
+    ).hexdigest()
+    return _cache_dir() / AUDIO_CACHE_DIR / f"{key}.mp3"
 
-    # Normalización final de espacios
-    full_text = " ".join(text_buffer)
-    return re.sub(r'\s+', ' ', full_text).strip()
+def _store_audio(path: Path, data: bytes) -> None:
+    """Guarda audio en caché de forma atómica; un fallo no es crítico."""
+    tmp = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Temporal único: otra ejecución puede estar guardando el mismo bloque
+        with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as f:
+            tmp = Path(f.name)
+            f.write(data)
+        os.replace(tmp, path)
+    except OSError as e:
+        if tmp is not None:
+            tmp.unlink(missing_ok=True)
+        logger.warning(f"⚠️ No se pudo guardar el audio en caché: {e}")
 
-async def stream_audio(config: AppConfig, text: str) -> bool:
-    """Genera audio con streaming y configuración de Timeouts."""
-    logger.info(f"📡 Conectando (Timeout: {config.connect_timeout}s)...")
-    
-    # ✅ USO OFICIAL: Timeouts explícitos y todos los parámetros
+def _load_audio(path: Path) -> Optional[bytes]:
+    """Lee audio de la caché (None si no está) y lo marca como usado."""
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return None
+    with contextlib.suppress(OSError):
+        os.utime(path) # El mtime hace de marca LRU
+    return data
+
+def _prune_audio_cache(max_bytes: int) -> None:
+    """Borra los bloques menos usados hasta dejar la caché bajo `max_bytes`."""
+    entries = []
+    now = time.time()
+    for path in (_cache_dir() / AUDIO_CACHE_DIR).glob("*"):
+        if path.suffix not in (".mp3", ".tmp"):
+            continue
+        with contextlib.suppress(OSError):
+            st = path.stat()
+            if path.suffix == ".tmp" and now - st.st_mtime > AUDIO_CACHE_TMP_MAX_AGE:
+                path.unlink() # Resto de una ejecución interrumpida
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        with contextlib.suppress(OSError):
+            path.unlink()
+            total -= size
+
+async def _iter_chunks(pages: AsyncIterator[str]) -> AsyncIterator[str]:
+    """
+    Reagrupa las páginas en bloques de ~CHUNK_CHARS que terminan en fin de
+    frase, para no cortar la entonación a mitad de oración.
+    """
+    buffer = ""
+    async for page in pages:
+        buffer = f"{buffer} {page}" if buffer else page
+        if len(buffer) < CHUNK_CHARS:
+            continue
+        sentences = _RE_SENTENCE.split(buffer)
+        if len(sentences) > 1:
+            # La última frase puede continuar en la página siguiente
+            yield " ".join(sentences[:-1])
+            buffer = sentences[-1]
+        else:
+            yield buffer
+            buffer = ""
+    if buffer:
+        yield buffer
+
+async def _synthesize(
+    config: AppConfig,
+    text: str,
+    on_data: Callable[[int], None]
+) -> bytes:
+    """Sintetiza un bloque completo en memoria, usando la caché si existe."""
+    cached = _audio_cache_path(config, text) if config.use_cache else None
+    if cached is not None:
+        # E/S de disco fuera del event loop
+        data = await asyncio.to_thread(_load_audio, cached)
+        if data is not None:
+            on_data(len(data))
+            return data
+
+    # ✅ USO OFICIAL: Timeouts explícitos y todos los parámetros. El texto no
+    # se sanea aquí: Communicate ya aplica remove_incompatible_characters
     communicate = edge_tts.Communicate(
         text=text,
         voice=config.voice,
@@ -148,41 +553,141 @@ async def stream_audio(config: AppConfig, text: str) -> bool:
         receive_timeout=config.receive_timeout
     )
 
+    audio = bytearray()
+    remote_error = False
+
+    # ✅ PATRÓN DE STREAMING: async for
+    async for chunk in communicate.stream():
+        if chunk["type"] == "audio":
+            data = chunk["data"]
+            audio += data
+            on_data(len(data))
+
+        elif chunk["type"] == "error":
+            logger.error("Error remoto: %s", chunk["message"]) # Formato diferido
+            remote_error = True
+
+    if cached is not None and audio and not remote_error:
+        await asyncio.to_thread(_store_audio, cached, bytes(audio))
+    return bytes(audio)
+
+async def stream_audio(
+    config: AppConfig,
+    pages: AsyncIterator[str],
+    stop: Optional[asyncio.Event] = None
+) -> bool:
+    """
+    Genera audio con streaming y configuración de Timeouts.
+    El texto se divide en bloques por frases que se sintetizan en paralelo
+    (hasta MAX_CONCURRENCY) y se escriben en orden en el mismo MP3 (los
+    frames MP3 se concatenan sin problema). Salvo con --no-cache, el audio de
+    cada bloque se cachea en disco (hasta AUDIO_CACHE_MAX_BYTES), así que
+    repetir una conversión no vuelve a la red.
+    Si se activa `stop` (Ctrl+C), se cancela y se borra el MP3 parcial.
+    """
+    logger.info(f"📡 Conectando (Timeout: {config.connect_timeout}s)...")
+
+    loop = asyncio.get_running_loop()
     total_bytes = 0
-    start_time = asyncio.get_running_loop().time()
+    total_chars = 0
+    start_time = loop.time()
+    last_ui = 0.0
+    output = None # El MP3 se crea con el primer bloque de audio
+
+    def show_progress() -> None:
+        mb = total_bytes / (1024 * 1024)
+        sys.stdout.write(f"\r   💾 Recibiendo: {mb:.2f} MB")
+        sys.stdout.flush()
+
+    def on_data(size: int) -> None:
+        nonlocal total_bytes, last_ui
+        total_bytes += size
+
+        # UX: Barra de progreso dinámica, limitada a ~10 Hz
+        now = loop.time()
+        if now - last_ui > PROGRESS_INTERVAL:
+            show_progress()
+            last_ui = now
+
+    def write(data: bytes) -> None:
+        nonlocal output
+        if output is None:
+            output = open(config.output_file, "wb", buffering=OUTPUT_BUFFER_SIZE)
+        output.write(data)
+
+    def discard_output() -> None:
+        # Solo se borra el MP3 si lo creó esta ejecución
+        if output is not None:
+            config.output_file.unlink(missing_ok=True)
+
+    async def write_audio() -> None:
+        nonlocal total_chars
+        pending: Deque[asyncio.Task] = deque()
+        chunks = _iter_chunks(pages)
+        try:
+            async for text in chunks:
+                total_chars += len(text)
+                pending.append(asyncio.create_task(_synthesize(config, text, on_data)))
+
+                # Escribe en orden lo ya terminado y limita las tareas en vuelo
+                while pending and (pending[0].done() or len(pending) >= MAX_CONCURRENCY):
+                    write(await pending.popleft())
+
+            while pending:
+                write(await pending.popleft())
+        finally:
+            for task in pending:
+                task.cancel()
+            if output is not None:
+                output.close()
+            # Cierra la cadena de generadores ya, no al apagar el loop: así el
+            # lector del PDF se detiene mientras el loop sigue vivo
+            await chunks.aclose()
+            if hasattr(pages, "aclose"):
+                await pages.aclose()
 
     try:
-        with open(config.output_file, "wb") as f:
-            # ✅ PATRÓN DE STREAMING: async for
-            async for chunk in communicate.stream():
-                if chunk["type"] == "audio":
-                    data = chunk["data"]
-                    f.write(data)
-                    total_bytes += len(data)
-                    
-                    # UX: Barra de progreso dinámica
-                    mb = total_bytes / (1024 * 1024)
-                    sys.stdout.write(f"\r   💾 Recibiendo: {mb:.2f} MB")
-                    sys.stdout.flush()
-                
-                elif chunk["type"] == "error":
-                    logger.error(f"Error remoto: {chunk['message']}")
+        writer = asyncio.create_task(write_audio())
+        if stop is not None:
+            stopper = asyncio.create_task(stop.wait())
+            await asyncio.wait({writer, stopper}, return_when=asyncio.FIRST_COMPLETED)
+            stopper.cancel()
+            if not writer.done():
+                writer.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await writer
+                sys.stdout.write("\n")
+                logger.warning("🛑 Cancelado por usuario.")
+                discard_output() # Sin MP3 a medias
+                return False
+        await writer
+
+        if config.use_cache:
+            await asyncio.to_thread(_prune_audio_cache, AUDIO_CACHE_MAX_BYTES)
 
+        show_progress() # Total exacto
         sys.stdout.write("\n")
-        duration = asyncio.get_running_loop().time() - start_time
-        logger.info(f"✅ Finalizado en {duration:.1f}s. Archivo: {config.output_file.name}")
+        if total_chars == 0:
+            logger.warning("⚠️ El PDF no contiene texto procesable.")
+            return True
+
+        duration = loop.time() - start_time
+        logger.info(
+            f"✅ Finalizado en {duration:.1f}s ({total_chars:,} chars). "
+            f"Archivo: {config.output_file.name}"
+        )
         return True
 
     # ✅ MANEJO DE EXCEPCIONES ESPECÍFICAS
     except (NoAudioReceived, UnexpectedResponse, WebSocketError) as e:
         sys.stdout.write("\n")
         logger.critical(f"❌ Error de API/Red: {e}")
-        if config.output_file.exists():
-            config.output_file.unlink() # Limpieza
+        discard_output() # Limpieza
         return False
     except Exception as e:
         sys.stdout.write("\n")
         logger.critical(f"❌ Error inesperado: {e}")
+        discard_output()
         return False
 
 # ═══════════════════════════════════════
@@ -203,6 +708,7 @@ async def main():
     parser.add_argument("--rate", default="-15%", help="Velocidad (ej: -15%)")
     parser.add_argument("--volume", default="+0%", help="Volumen (ej: +10%)")
     parser.add_argument("--pitch", default="+0Hz", help="Tono (ej: +5Hz)")
+    parser.add_argument("--no-cache", action="store_true", help="No usar la caché de audio")
 
     args = parser.parse_args()
 
@@ -215,6 +721,7 @@ async def main():
     try:
         # Validación temprana
         validate_voice_params(args.rate, args.volume, args.pitch)
+        validate_voice(args.voice)
         
         output_path = args.output or args.input.with_suffix('.mp3')
         
@@ -224,20 +731,36 @@ async def main():
             voice=args.voice,
             rate=args.rate,
             volume=args.volume,
-            pitch=args.pitch
+            pitch=args.pitch,
+            use_cache=not args.no_cache
         )
 
-        clean_text = extract_clean_text(config.input_file)
-        if not clean_text:
-            logger.warning("⚠️ El PDF no contiene texto procesable.")
-            return
+        # PDF inexistente, vacío o corrupto: fallar antes de crear el MP3
+        total = await asyncio.to_thread(_page_count, config.input_file)
 
-        print(f"📊 Texto: {len(clean_text):,} chars | Voz: {config.voice}")
+        print(f"📊 Entrada: {config.input_file.name} ({total} págs.) | Voz: {config.voice}")
         print("═" * 60)
-        
-        success = await stream_audio(config, clean_text)
+
+        # Ctrl+C cancela la síntesis de forma ordenada (no disponible en Windows)
+        loop = asyncio.get_running_loop()
+        stop = asyncio.Event()
+        with contextlib.suppress(NotImplementedError):
+            loop.add_signal_handler(signal.SIGINT, stop.set)
+
+        stats = PageStats()
+        try:
+            # Lectura del PDF y síntesis solapadas, página a página
+            pages = iter_pages(config.input_file, total, stats)
+            success = await stream_audio(config, pages, stop)
+        finally:
+            with contextlib.suppress(NotImplementedError):
+                loop.remove_signal_handler(signal.SIGINT)
         if not success: sys.exit(1)
 
+        # Al final: durante la síntesis la línea es de la barra de progreso
+        if stats.skipped:
+            logger.info(f"⏭️ {stats.skipped}/{stats.pages} páginas sin texto (¿escaneadas?) omitidas.")
+
     except ValueError as ve:
         logger.error(str(ve))
         sys.exit(1)